@@ -259,12 +259,11 @@ class gaussian_test(underlying_noise, metrics, AutoCorrelation):
 		s = noise.size
 		if s == 0:
 			print('Warning : Length of noise is 0')
-		kl_dist = []
-		#for _ in tqdm(range(10000), desc='Gaussian check for underlying noise'):
-		for _ in tqdm(range(1000)):
-			p = np.random.normal(size=s)
-			q = np.random.normal(size=s)
-			kl_dist.append(self._kl_divergence(p, q))
+		# Draw the whole null ensemble in one batch and evaluate the
+		# divergence row-wise, instead of looping over 1000 sample pairs.
+		p = np.random.normal(size=(1000, s))
+		q = np.random.normal(size=(1000, s))
+		kl_dist = self._kl_divergence(p, q)
 		l_lim, h_lim = self._get_critical_values(kl_dist)
 		k = self._kl_divergence(noise, np.random.normal(size=s))
 		gaussian_noise = True if k >= l_lim and k <= h_lim else False
@@ -1,3 +1,4 @@
+import logging
 import numpy as np
 import scipy.linalg
 import shutil
@@ -6,6 +7,21 @@ import sympy
 import os
 from scipy.spatial.distance import jensenshannon
 
+log = logging.getLogger(__name__)
+
+
+def _plane_basis(x, y, order):
+	"""
+	Design matrix [1, x, y, x^n, x^(n-1)*y, ..., y^n] of an order-n plane,
+	built in a single pass without stacking columns one at a time. The
+	power tables come from np.vander, which accumulates x * x * ... by
+	repeated multiplication rather than calling pow per column.
+
+	:meta private:
+	"""
+	Px = np.vander(x, order + 1, increasing=True)
+	Py = np.vander(y, order + 1, increasing=True)
+	return np.column_stack((np.ones(x.shape[0]), x, y, Px[:, ::-1] * Py))
 
 
 class metrics:
@@ -121,9 +137,69 @@ class metrics:
 		nan_idx = np.argwhere(np.isnan(y))
 		x_ = np.delete(x, nan_idx)
 		y_ = np.delete(y, nan_idx)
-		z = np.polyfit(x_, y_, deg)
+		# Solve the least-squares system directly on the Vandermonde matrix;
+		# skips np.polyfit's per-call validation overhead in the order sweeps.
+		A = np.vander(x_, deg + 1)
+		scale = np.sqrt(np.square(A).sum(axis=0))
+		z = scipy.linalg.lstsq(A / scale, y_, lapack_driver='gelsy',
+							   check_finite=False)[0] / scale
 		return np.poly1d(z), x_
 
+	def _fit_poly_sweep(self, x, y, max_deg):
+		"""
+		Fit polynomials of every degree below `max_deg` to the same data
+
+		The Vandermonde matrix and its normal equations are built once at the
+		largest degree; every lower-degree fit solves the leading subsystem
+		of the same Gram matrix, instead of rebuilding and refactoring the
+		design matrix per degree as repeated `_fit_poly` calls would.
+
+		Parameters
+		----------
+		x : array
+			independent variable
+		y : array
+			depended variable
+		max_deg : int
+			one above the largest degree to fit
+
+		Returns
+		-------
+		polys : list of numpy.poly1d
+			fitted polynomials of degree 0, 1, ..., max_deg - 1
+		x : array
+			values of x for where y in defined
+
+		Notes
+		-----
+		The nan values in the input x and y (if any) will be ignored.
+		"""
+		nan_idx = np.argwhere(np.isnan(y))
+		x_ = np.delete(x, nan_idx)
+		y_ = np.delete(y, nan_idx)
+		# The Gram matrix of a Vandermonde is a Hankel matrix of power sums,
+		# G[j, k] = sum(x**(j + k)): build it from the moments of x in
+		# O(N * max_deg) instead of an O(N * max_deg^2) matmul over the
+		# explicit design matrix.
+		V = np.vander(x_, 2 * max_deg - 1, increasing=True)
+		m = V.sum(axis=0)
+		j = np.arange(max_deg)
+		scale = np.sqrt(m[2 * j])
+		G = m[np.add.outer(j, j)] / np.outer(scale, scale)
+		b = (V[:, :max_deg].T @ y_) / scale
+		polys = []
+		for deg in range(max_deg):
+			k = deg + 1
+			try:
+				z = scipy.linalg.cho_solve(
+					scipy.linalg.cho_factor(G[:k, :k]), b[:k]) / scale[:k]
+			except scipy.linalg.LinAlgError:
+				A = np.vander(x_, k, increasing=True) / scale[:k]
+				z = scipy.linalg.lstsq(A, y_, lapack_driver='gelsy',
+									   check_finite=False)[0] / scale[:k]
+			polys.append(np.poly1d(z[::-1]))
+		return polys, x_
+
 	def _nan_helper(self, x):
 		"""
 		Helper function used to handle missing data
@@ -170,18 +246,18 @@ class metrics:
 		Parameters
 		----------
 		p : array
-			distrubution p
+			distrubution p, or a stack of distrubutions in rows
 		q : array
-			distrubution q
+			distrubution q, or a stack of distrubutions in rows
 
 		Returns
 		-------
-		kl_divergence : float
-			kl divergence between p and q
+		kl_divergence : float or array
+			kl divergence between p and q, per row for stacked inputs
 		"""
 		k = p * np.log(np.abs(((p + 1e-100) / (q + 1e-100))))
 		# k[np.where(np.isnan(k))] = 0
-		return np.nansum(k)
+		return np.nansum(k, axis=-1)
 
 	def _divergence(self, a, b):
 		"""
@@ -233,25 +309,26 @@ class metrics:
 			returns z = f(x,y), where f(x,y) is the fitted function
 			of the plane.
 		"""
-		x = x[~np.isnan(z)]
-		y = y[~np.isnan(z)]
-		z = z[~np.isnan(z)]
-		
-		A = np.c_[np.ones(x.shape[0]), x.flatten(), y.flatten()]
-		n = order
-		
-		for k in range(n+1):
-			A = np.column_stack((A, x**(n-k)*y**k))
-		
+		# Flatten and cast once; boolean indexing below already yields flat,
+		# contiguous float64 arrays for the BLAS-backed solve.
+		x = np.asarray(x, dtype=float).ravel()
+		y = np.asarray(y, dtype=float).ravel()
+		z = np.asarray(z, dtype=float).ravel()
+		good = ~np.isnan(z)
+		x, y, z = x[good], y[good], z[good]
+
+		A = _plane_basis(x, y, order)
+
 		try:
-			C, _, _, _ = scipy.linalg.lstsq(A, z)
+			C, _, _, _ = scipy.linalg.lstsq(A, z, lapack_driver='gelsy',
+											check_finite=False)
 		except Exception as e:
 			if e.__class__.__name__ == 'ValueError':
-				print("Unable to fit plane, incompatable parameters")
+				log.warning("Unable to fit plane, incompatable parameters")
 			elif e.__class__.__name__ == 'LinAlgError':
-				print("Unable to fit plane, computation doesnot converge")
+				log.warning("Unable to fit plane, computation doesnot converge")
 			else:
-				print("Unable to fit plane, {}".format(e.__class__.__name__))
+				log.warning("Unable to fit plane, {}".format(e.__class__.__name__))
 			return None
 		return Plane(coefficients=C, order=order)
 
@@ -411,16 +488,16 @@ class metrics:
 
 			if drift_time_scale is not None:
 				if drift_time_scale not in self._drift_slider.keys():
-					print("\n{} not in list:\n{}".format(drift_time_scale, self._drift_slider.keys()))
+					log.warning("{} not in list: {}".format(drift_time_scale, self._drift_slider.keys()))
 					drift_time_scale = self._closest_time_scale(drift_time_scale, self._drift_slider)
-					print("Choosing {}; (closest matching timescale from the avaiable ones)".format(drift_time_scale))
+					log.warning("Choosing {}; (closest matching timescale from the avaiable ones)".format(drift_time_scale))
 				drift_x, drift_y = self._drift_slider[drift_time_scale][0],self._drift_slider[drift_time_scale][1]
 
 			if diff_time_scale is not None:
 				if diff_time_scale not in self._diff_slider.keys():
-					print("\n{} not in list:\n{}".format(diff_time_scale, self._diff_slider.keys()))
+					log.warning("{} not in list: {}".format(diff_time_scale, self._diff_slider.keys()))
 					diff_time_scale = self._closest_time_scale(diff_time_scale, self._diff_slider)
-					print("Choosing {}; (closest matching timescale from the avaiable ones)".format(diff_time_scale))
+					log.warning("Choosing {}; (closest matching timescale from the avaiable ones)".format(diff_time_scale))
 				diff_x, diff_y = self._diff_slider[diff_time_scale][0],	self._diff_slider[diff_time_scale][1]
 				diff_xy, diff_yx = self._cross_diff_slider[diff_time_scale][0],	self._cross_diff_slider[diff_time_scale][1]
 
@@ -434,16 +511,16 @@ class metrics:
 
 			if drift_time_scale is not None:
 				if drift_time_scale not in self._drift_slider.keys():
-					print("\n{} not in list:\n{}".format(drift_time_scale, self._drift_slider.keys()))
+					log.warning("{} not in list: {}".format(drift_time_scale, self._drift_slider.keys()))
 					drift_time_scale = self._closest_time_scale(drift_time_scale, self._drift_slider)
-					print("Choosing {}; (closest matching timescale from the avaiable ones)".format(drift_time_scale))
+					log.warning("Choosing {}; (closest matching timescale from the avaiable ones)".format(drift_time_scale))
 				drift = self._drift_slider[drift_time_scale][0]
 
 			if diff_time_scale is not None:
 				if diff_time_scale not in self._diff_slider.keys():
-					print("\n{} not in list:\n{}".format(diff_time_scale, self._diff_slider.keys()))
+					log.warning("{} not in list: {}".format(diff_time_scale, self._diff_slider.keys()))
 					diff_time_scale = self._closest_time_scale(diff_time_scale, self._diff_slider)
-					print("Choosing {}; (closest matching timescale from the avaiable ones)".format(diff_time_scale))
+					log.warning("Choosing {}; (closest matching timescale from the avaiable ones)".format(diff_time_scale))
 				diff = self._diff_slider[diff_time_scale][0]
 
 			return drift, diff
@@ -581,6 +658,16 @@ class Plane:
 	def __init__(self, coefficients, order):
 		self.coeff = coefficients
 		self.order = order
+		# Coefficients arranged on the (x power, y power) grid, so the plane
+		# can be evaluated with the Horner scheme of polyval2d instead of
+		# summing explicit monomials.
+		C = np.zeros((max(order, 1) + 1, max(order, 1) + 1))
+		C[0, 0] = self.coeff[0]
+		C[1, 0] += self.coeff[1]
+		C[0, 1] += self.coeff[2]
+		for k in range(order + 1):
+			C[order - k, k] += self.coeff[3 + k]
+		self._coeff_grid = C
 
 	def expr(self):
 		a = sympy.Symbol('x')
@@ -598,10 +685,4 @@ class Plane:
 		return str(self.expr())
 
 	def __call__(self, x, y):
-		X = x.flatten()
-		Y = y.flatten()
-		a = np.c_[np.ones(X.shape[0]), X, Y]
-		n = self.order
-		for k in range(n+1):
-			a = np.column_stack((a, X**(n-k)*Y**k))
-		return np.dot(a, self.coeff).reshape(x.shape)
+		return np.polynomial.polynomial.polyval2d(x, y, self._coeff_grid)
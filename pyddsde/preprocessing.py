@@ -24,13 +24,13 @@ class preprocessing(gaussian_test):
 		"""
 		r2_drift = []
 		r2_diff = []
+		p_drifts, _ = self._fit_poly_sweep(x=op1, y=avgDrift, max_deg=max_order)
+		p_diffs, _ = self._fit_poly_sweep(x=op2, y=avgDiff, max_deg=max_order)
 		for i in range(max_order):
-			p_drift, _ = self._fit_poly(x=op1, y=avgDrift, deg=i)
-			p_diff, _ = self._fit_poly(x=op2, y=avgDiff, deg=i)
 			r2_drift.append(
-				self._R2(data=avgDrift, op=op1, poly=p_drift, k=i, adj=True))
+				self._R2(data=avgDrift, op=op1, poly=p_drifts[i], k=i, adj=True))
 			r2_diff.append(
-				self._R2(data=avgDiff, op=op2, poly=p_diff, k=i, adj=True))
+				self._R2(data=avgDiff, op=op2, poly=p_diffs[i], k=i, adj=True))
 		return r2_drift, r2_diff
 
 	def _remove_nan(self, x, y, sample_size=10):
@@ -212,6 +212,11 @@ class preprocessing(gaussian_test):
 		Initailize and validate all inputs.
 		"""
 
+		# Cached drift/diffusion results belong to the previously bound data
+		# and time step; drop them whenever inputs are (re)validated.
+		self._dd_cache = {}
+		self._vector_dd_cache = {}
+
 		if not isinstance(self._data, list):
 			raise InputError('Characterize(data=[Mx,My],...)',
 							 'data input must be a list of length 1 or 2!')
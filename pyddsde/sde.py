@@ -64,16 +64,20 @@ class SDE:
         """
 
         # return np.array([b - a for a, b in zip(X, X[Dt:])]) / (t_int * Dt)
-        return (X[Dt:] - X[:-Dt]) / (t_int * Dt)
+        drift = np.subtract(X[Dt:], X[:-Dt], dtype=np.float64)
+        drift /= t_int * Dt
+        return drift
 
     def _residual(self, X, t_int, Dt, dt=1):
         """
         Get the residual.
         """
         p = len(X) - max(dt, Dt)
-        drift = self._drift(X, t_int, Dt)[:p]
-        res = (X[dt:] - X[:-dt])[:p]
-        return res - drift*(t_int*dt)
+        res = np.subtract(X[dt:dt + p], X[:p], dtype=np.float64)
+        drift = self._drift(X, t_int, Dt)
+        drift *= t_int * dt
+        res -= drift[:p]
+        return res
 
     def _diffusion(self, X, t_int, dt=1):
         """
@@ -95,7 +99,10 @@ class SDE:
         """
 
         # return np.square(np.array([b - a for a, b in zip(X, X[dt:])])) / (t_int * dt)
-        return np.square(X[dt:] - X[:-dt]) / (t_int * dt)
+        diff = np.subtract(X[dt:], X[:-dt], dtype=np.float64)
+        np.square(diff, out=diff)
+        diff /= t_int * dt
+        return diff
 
     def _diffusion_xy(self, x, y, t_int, dt):
         """
@@ -116,7 +123,10 @@ class SDE:
         diffusion_xy : numpy.array
                 cross-correlation coefficients between x and y data
         """
-        return ((x[dt:] - x[:-dt]) * (y[dt:] - y[:-dt])) / (dt * t_int)
+        diff_xy = np.subtract(x[dt:], x[:-dt], dtype=np.float64)
+        diff_xy *= np.subtract(y[dt:], y[:-dt])
+        diff_xy /= dt * t_int
+        return diff_xy
         #return np.array([(b - a) * (d - c) for a, b, c, d in zip(x, x[dt:], y, y[dt:])]) / (dt * t_int)
 
     def _diffusion_yx(self, x, y, t_int, dt):
@@ -138,7 +148,7 @@ class SDE:
         diffusion_xy : numpy.array
                 cross-correlation coefficients between y and x data
         """
-        return ((x[dt:] - x[:-dt]) * (y[dt:] - y[:-dt])) / (dt * t_int)
+        return self._diffusion_xy(y, x, t_int, dt)
 
     def _isValidRange(self, r):
         """
@@ -185,7 +195,11 @@ class SDE:
         if self.bins:
             #return np.linspace(min(X), max(X), self.bins)
             return np.linspace(r[0], r[-1], self.bins)
-        return np.arange(min(r), max(r)+inc, inc)
+        lo, hi = min(r), max(r)
+        # linspace with an explicit point count gives float-safe, stable bin
+        # edges; np.arange with a fractional step can gain or lose the end
+        # point to rounding.
+        return np.linspace(lo, hi, int(round((hi - lo) / inc)) + 1)
 
 
     def _drift_and_diffusion(self, X, t_int, Dt, dt, inc):
@@ -217,21 +231,70 @@ class SDE:
             average drift 
         op : array
             order parameter
+
+        Notes
+        -----
+        The averaging is a single searchsorted/bincount pass, equivalent to
+        scipy.stats.binned_statistic with mean and std statistics, except
+        that the bins here are [b, b + inc) around each order parameter
+        value and need not tile the data range, which binned_statistic's
+        contiguous bin edges cannot express.
+
+        Results are cached per (t_int, Dt, dt, inc) combination: the order
+        sweep, the main analysis and the slider generation all revisit the
+        same timescales on the same time series within one analysis. The
+        cache is cleared by `_validate_inputs` whenever data is (re)bound,
+        and hands out copies so callers cannot corrupt cached entries.
         """
+        key = (len(X), t_int, Dt, dt, inc)
+        cache = getattr(self, "_dd_cache", None)
+        if cache is None:
+            cache = self._dd_cache = {}
+        if key in cache:
+            return tuple(a.copy() for a in cache[key])
         op = self._order_parameter(X, inc, self.op_range)
-        avgdiff, avgdrift = [], []
         drift = self._drift(X, t_int, Dt)
         diff = self._diffusion(X, t_int, dt=dt)
-        drift_ebar = []
-        diff_ebar = []
         X = X[0 : -max(Dt, dt)]
-        for b in op:
-            i = np.where(np.logical_and(X < (b + inc), X >= b))[0]
-            avgdiff.append(diff[i].mean())
-            avgdrift.append(drift[i].mean())
-            drift_ebar.append(drift[i].std()/np.sqrt(len(drift[i])))
-            diff_ebar.append(diff[i].std()/np.sqrt(len(diff[i])))
-        return diff, drift, np.array(avgdiff), np.array(avgdrift), op, drift_ebar, diff_ebar
+        # Locate each point's bins [b, b + inc) in a single pass instead of
+        # scanning X once per bin. As in _vector_drift_diff, a bin can
+        # overlap its neighbours when inc exceeds the bin spacing, so each
+        # point is checked against the few candidate bins below its
+        # insertion index; points in the gap between two bins are dropped,
+        # as before.
+        hi = np.searchsorted(op, X, side="right")
+        values = (drift[:len(X)], diff[:len(X)])
+        cnt = np.zeros(len(op))
+        sums = np.zeros((len(values), len(op)))
+        sqsums = np.zeros((len(values), len(op)))
+        for j in range(self._bin_multiplicity(op, inc)):
+            k = hi - 1 - j
+            ok = np.logical_and(k >= 0, X < op[np.clip(k, 0, None)] + inc)
+            i = np.flatnonzero(ok)
+            if not len(i):
+                break
+            idx = k[i]
+            cnt += np.bincount(idx, minlength=len(op))
+            for row, v in enumerate(values):
+                vi = v[i]
+                sums[row] += np.bincount(idx, weights=vi, minlength=len(op))
+                sqsums[row] += np.bincount(idx, weights=np.square(vi), minlength=len(op))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avgdrift, drift_ebar = self._binned_mean_ebar(sums[0], sqsums[0], cnt)
+            avgdiff, diff_ebar = self._binned_mean_ebar(sums[1], sqsums[1], cnt)
+        result = diff, drift, avgdiff, avgdrift, op, drift_ebar, diff_ebar
+        cache[key] = tuple(a.copy() for a in result)
+        return result
+
+    def _binned_mean_ebar(self, s1, s2, cnt):
+        """
+        Mean and standard error per bin from the accumulated sum, sum of
+        squares and count, using the sum-of-squares identity for the
+        standard deviation.
+        """
+        mean = s1 / cnt
+        var = np.clip(s2 / cnt - np.square(mean), 0, None)
+        return mean, np.sqrt(var) / np.sqrt(cnt)
 
     def _vector_drift_diff(self, x, y, inc_x, inc_y, t_int, Dt, dt):
         """
@@ -256,7 +319,18 @@ class SDE:
         -------
         list
             [avgdriftX, avgdriftY, avgdiffX, avgdiffY, avgdiffXY, op_x, op_y]
+
+        Notes
+        -----
+        Results are cached per (t_int, Dt, dt, inc_x, inc_y) combination, as
+        for `_drift_and_diffusion`.
         """
+        key = (len(x), t_int, Dt, dt, inc_x, inc_y)
+        cache = getattr(self, "_vector_dd_cache", None)
+        if cache is None:
+            cache = self._vector_dd_cache = {}
+        if key in cache:
+            return [a.copy() for a in cache[key]]
 
         op_x = self._order_parameter(x, inc_x, self.op_x_range)
         op_y = self._order_parameter(y, inc_y, self.op_y_range)
@@ -270,34 +344,52 @@ class SDE:
         diffusionXY = self._diffusion_xy(x, y, t_int, dt)
         diffusionYX = self._diffusion_yx(x, y, t_int, dt)
 
-        avgdriftX = np.zeros((len(op_x), len(op_y)))
-        avgdriftY = np.zeros((len(op_x), len(op_y)))
-        avgdiffX = np.zeros((len(op_x), len(op_y)))
-        avgdiffY = np.zeros((len(op_x), len(op_y)))
-        avgdiffXY = np.zeros((len(op_x), len(op_y)))
-        avgdiffYX = np.zeros((len(op_x), len(op_y)))
-
-
-        m = 0
         x_, y_ = x[0 : -max(Dt, dt)], y[0 : -max(Dt, dt)]
-        for bin_x in op_y:
-            n = 0
-            for bin_y in op_x:
-                i = np.where(
-                    np.logical_and(
-                        np.logical_and(x_ < (bin_x + inc_x), x_ >= bin_x),
-                        np.logical_and(y_ < (bin_y + inc_y), y_ >= bin_y),
-                    )
-                )[0]
-                avgdriftX[n, m] = np.nanmean(driftX[i])
-                avgdriftY[n, m] = np.nanmean(driftY[i])
-                avgdiffX[n, m] = np.nanmean(diffusionX[i])
-                avgdiffY[n, m] = np.nanmean(diffusionY[i])
-                avgdiffXY[n, m] = np.nanmean(diffusionXY[i])
-                avgdiffYX[n, m] = np.nanmean(diffusionYX[i])
-                n = n + 1
-            m = m + 1
-        return [avgdriftX, avgdriftY, avgdiffX, avgdiffY, avgdiffXY, avgdiffYX, op_x, op_y]
+        # Vectorized 2D binning: locate each point's bins with searchsorted
+        # instead of one np.where scan per grid cell. The grid orientation
+        # matches the old double loop, where columns run over op_y bins of x
+        # and rows over op_x bins of y. A bin [b, b + inc) can overlap its
+        # neighbours when inc exceeds the grid spacing, so each point is
+        # checked against the few candidate bins below its insertion index.
+        hi_x = np.searchsorted(op_y, x_, side="right")
+        hi_y = np.searchsorted(op_x, y_, side="right")
+        size = len(op_x) * len(op_y)
+        values = [v[:len(x_)] for v in
+                  (driftX, driftY, diffusionX, diffusionY, diffusionXY, diffusionYX)]
+        sums = np.zeros((len(values), size))
+        cnts = np.zeros((len(values), size))
+        for jx in range(self._bin_multiplicity(op_y, inc_x)):
+            kx = hi_x - 1 - jx
+            okx = np.logical_and(kx >= 0, x_ < op_y[np.clip(kx, 0, None)] + inc_x)
+            if not okx.any():
+                break
+            for jy in range(self._bin_multiplicity(op_x, inc_y)):
+                ky = hi_y - 1 - jy
+                oky = np.logical_and(ky >= 0, y_ < op_x[np.clip(ky, 0, None)] + inc_y)
+                i = np.flatnonzero(np.logical_and(okx, oky))
+                if not len(i):
+                    break
+                flat = ky[i] * len(op_y) + kx[i]
+                for j, v in enumerate(values):
+                    vi = v[i]
+                    good = ~np.isnan(vi)
+                    cnts[j] += np.bincount(flat[good], minlength=size)
+                    sums[j] += np.bincount(flat[good], weights=vi[good], minlength=size)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            averages = (sums / cnts).reshape(-1, len(op_x), len(op_y))
+        avgdriftX, avgdriftY, avgdiffX, avgdiffY, avgdiffXY, avgdiffYX = averages
+        result = [avgdriftX, avgdriftY, avgdiffX, avgdiffY, avgdiffXY, avgdiffYX, op_x, op_y]
+        cache[key] = [a.copy() for a in result]
+        return result
+
+    def _bin_multiplicity(self, op, inc):
+        """
+        Maximum number of bins [b, b + inc) that can contain one point, for
+        bin edges `op`; greater than one when inc exceeds the edge spacing.
+        """
+        if len(op) < 2:
+            return 1
+        return max(1, int(np.ceil(inc / np.min(np.diff(op)))) + 1)
 
     def __call__(self, X, t_int, Dt, dt=1, inc=0.01, **kwargs):
         """